@@ -2,22 +2,43 @@
 
 import logging
 import os
+import re
 from typing import Optional
 
 # Search Configuration
 SEARCH_TEXT = "Data Scientist"
 MAX_SCROLL_ATTEMPTS = 20
 MAX_POSTS = 10
+# Maximum number of search queries scraped at the same time by `scrape_jobs`.
+SEARCH_CONCURRENCY = 5
 
 # Timing Configuration
 MIN_SLEEP_TIME = 1
 MAX_SLEEP_TIME = 4
 WEBDRIVER_WAIT_TIMEOUT = 10  # seconds
+# How long a scroll waits for more posts to load before the page is
+# considered fully loaded.
+SCROLL_LOAD_TIMEOUT = 3  # seconds
+# Run Firefox without a window; set LINKEDIN_HEADLESS=0 to watch the browser,
+# e.g. to solve a login challenge by hand.
+HEADLESS_BROWSER = os.getenv("LINKEDIN_HEADLESS", "1") != "0"
 RUN_INTERVAL = 1800  # seconds (30 minutes)
 
 # File Configuration
 OUTPUT_CSV_FILENAME = "linkedin_jobs.csv"
+# Raw, unclassified posts written when the scraper runs on its own
+SCRAPED_POSTS_CSV_FILENAME = "linkedin_posts.csv"
+# LinkedIn session cookies saved after a successful login, so new browsers and
+# later runs can skip the login form. Delete the file to force a fresh login.
+LINKEDIN_COOKIES_PATH = os.getenv(
+    "LINKEDIN_COOKIES_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "linkedin-scrape", "cookies.json"),
+)
 CSV_FIELDNAMES = ["content", "url", "profile_name"]
+# The scraper keeps its CSV open with a 1 MiB write buffer and flushes it to
+# disk after this many rows, at the end of each scrape cycle and on close.
+CSV_BUFFER_SIZE = 1 << 20
+CSV_FLUSH_ROWS = 1000
 
 # Location Data
 INDIAN_CITIES = [
@@ -33,6 +54,9 @@ INDIAN_CITIES = [
     "gurgaon",
     "bengaluru"
 ]
+INDIAN_CITIES_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, INDIAN_CITIES)) + r")\b", re.IGNORECASE
+)
 
 # Job-related Keywords for Filtering
 JOB_KEYWORDS = [
@@ -54,9 +78,44 @@ JOB_KEYWORDS = [
     r"urgent hiring",
     r"job description"
 ]
+# Single precompiled alternation of JOB_KEYWORDS, shared by every filter so a
+# post is scanned once instead of once per keyword. Anchored at word starts
+# only, so plurals and inflections ("jobs", "openings") still match.
+JOB_KEYWORDS_RE = re.compile(r"\b(?:" + "|".join(JOB_KEYWORDS) + r")", re.IGNORECASE)
+# Drop posts matching none of JOB_KEYWORDS while scraping, before their details
+# are extracted, instead of passing them on to classification.
+SCRAPE_JOB_POSTS_ONLY = True
 
 MODEL_NAME = "deepseek-r1:1.5b"
 
+# Ollama Inference Configuration
+# Match these to the values the Ollama server was launched with so the client
+# never queues more concurrent requests than the server has parallel slots.
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+OLLAMA_MAX_LOADED_MODELS = int(os.getenv("OLLAMA_MAX_LOADED_MODELS", "1"))
+# How long the server keeps the model loaded after a request; longer than
+# RUN_INTERVAL so the weights stay resident between pipeline iterations.
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+# Number of posts packed into a single classification prompt. Larger batches
+# amortize the system prompt and HTTP round-trip over more posts, but long
+# outputs make small models lose track of the ordering; tune empirically.
+BATCH_SIZE = 8
+# Each input is cut to this many characters before it is sent to the model;
+# the tail of a long post is almost always boilerplate.
+MAX_INPUT_CHARS = 1000
+# Context window per request: the system prompt plus a full batch of
+# truncated inputs (~3 characters per token). It must stay constant, since
+# the server reloads the model whenever num_ctx changes.
+OLLAMA_NUM_CTX = 512 + BATCH_SIZE * MAX_INPUT_CHARS // 3
+# Token budget for the JSON answer, which only grows with the batch size.
+OLLAMA_NUM_PREDICT = 16 + 4 * BATCH_SIZE
+# Maximum number of (prompt, input) classifications remembered across iterations.
+INFERENCE_CACHE_SIZE = 4096
+# Posts matching both JOB_KEYWORDS and INDIAN_CITIES are labelled as hiring,
+# and posts at least this long matching neither are labelled as non-hiring,
+# without asking the model. Everything in between goes to the model.
+KEYWORD_PREFILTER_MIN_LENGTH = 500
+
 LOG_LEVEL_NAME = os.getenv("LINKEDIN_LOG_LEVEL", "INFO").upper()
 LOG_FORMAT_DEFAULT = os.getenv(
     "LINKEDIN_LOG_FORMAT",
@@ -69,28 +128,30 @@ def configure_logging(level: Optional[int] = None, format: Optional[str] = None)
     logging.basicConfig(level=level or LOG_LEVEL, format=format or LOG_FORMAT_DEFAULT)
 
 PROMPT_NAMES_CLASSIFICATION = (
-    "Classify the following text as an Indian name or not. "
-    "Output your answer in the following structured JSON format:\n\n"
-    "{\n  \"classification\": 0 or 1\n}\n\n"
+    "You will be given a numbered list of texts, one per line, each prefixed with its index in square brackets (e.g. [0], [1]). "
+    "Classify each text as an Indian name or not. "
+    "Output your answer in the following structured JSON format, with exactly one classification per text in the same order as the list:\n\n"
+    "{\n  \"classifications\": [0 or 1, ...]\n}\n\n"
     "Rules:\n"
-    "- Respond with \"classification\": 0 if the text is clearly not an Indian name.\n"
-    "- Respond with \"classification\": 1 if the text is an Indian name, cannot be classified, or appears to be an organization name.\n"
+    "- Use 0 if the text is clearly not an Indian name.\n"
+    "- Use 1 if the text is an Indian name, cannot be classified, or appears to be an organization name.\n"
     "Strictly provide only the JSON output above without any extra explanation or text."
 )
 
 PROMPT_HIRING_POST = (
-    "You will be given the content of a LinkedIn post. Analyze the post and determine if it is related to hiring, job postings, or recruitment activities. "
+    "You will be given a numbered list of LinkedIn posts, each prefixed with its index in square brackets (e.g. [0], [1]). "
+    "Analyze each post and determine if it is related to hiring, job postings, or recruitment activities. "
     "A hiring post generally refers to announcements or advertisements about job openings, available positions, recruitment drives, or opportunities that seek candidates. "
     "\n\n"
     "Instructions:\n"
-    "1. Carefully review the LinkedIn post provided.\n"
-    "2. Decide if it can be considered a hiring/recruitment-related post based on keywords, intent, and context.\n"
-    "3. Output your result strictly in the following JSON format:\n"
+    "1. Carefully review every LinkedIn post provided.\n"
+    "2. Decide for each post if it can be considered a hiring/recruitment-related post based on keywords, intent, and context.\n"
+    "3. Output your result strictly in the following JSON format, with exactly one classification per post in the same order as the list:\n"
     "{\n"
-    '  "classification": 1 or 0\n'
+    '  "classifications": [1 or 0, ...]\n'
     "}\n"
     "\nRules:\n"
-    "- Respond with \"classification\": 1 if the post is a hiring/recruitment post.\n"
-    "- Respond with \"classification\": 0 if the post is not related to hiring or recruitment.\n"
+    "- Use 1 if the post is a hiring/recruitment post.\n"
+    "- Use 0 if the post is not related to hiring or recruitment.\n"
     "- Do NOT include any explanation, extra text, or context; only reply with the JSON as shown above.\n"
 )
\ No newline at end of file
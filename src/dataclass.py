@@ -4,4 +4,10 @@ class HiringPost(BaseModel):
     classification: int
     
 class NamesClassification(BaseModel):
-    classification: int
\ No newline at end of file
+    classification: int
+
+class HiringPostBatch(BaseModel):
+    classifications: list[int]
+
+class NamesClassificationBatch(BaseModel):
+    classifications: list[int]
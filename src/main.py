@@ -1,29 +1,60 @@
 """Pipeline entry for scraping LinkedIn posts and running model inference."""
 
 import argparse
+import asyncio
+import csv
 import logging
 import os
+import signal
+import threading
 import time
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Type, Union
 
-import pandas as pd
+from ollama import AsyncClient
+from pydantic import BaseModel, ValidationError
 from tqdm import tqdm
 
 from src.config.settings import (
+    BATCH_SIZE,
+    MAX_INPUT_CHARS,
     MODEL_NAME,
+    OLLAMA_NUM_PARALLEL,
     OUTPUT_CSV_FILENAME,
     PROMPT_HIRING_POST,
     PROMPT_NAMES_CLASSIFICATION,
     configure_logging,
 )
-from src.dataclass import HiringPost, NamesClassification
+from src.dataclass import HiringPostBatch, NamesClassificationBatch
 from src.ollama_setup import OllamaModelSetup
 from src.scrape import LinkedInJobScraper
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 logger = logging.getLogger(__name__)
 
 
+def _get_pd():
+    """Import pandas on first use; only the optional DataFrame helpers need it."""
+    import pandas as pd
+
+    return pd
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most `size` items from `iterable`."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _format_batch(texts: List[str]) -> str:
+    """Render texts, truncated to `MAX_INPUT_CHARS`, as the numbered list expected by the batch prompts."""
+    return "\n".join(f"[{index}] {text[:MAX_INPUT_CHARS]}" for index, text in enumerate(texts))
+
+
 class ScrapeAndClassify:
     """Coordinate scraping LinkedIn posts and running classification models."""
 
@@ -34,6 +65,7 @@ class ScrapeAndClassify:
         search_text: Optional[str] = None,
         max_scroll_attempts: Optional[int] = None,
     ) -> None:
+        self._seen_urls = self._load_seen_urls()
         self.ollama_model_setup = OllamaModelSetup(model_name=MODEL_NAME)
         self.scraper = LinkedInJobScraper(
             email=email,
@@ -41,6 +73,8 @@ class ScrapeAndClassify:
             search_text=search_text,
             max_scroll_attempts=max_scroll_attempts,
         )
+        # Lets the scraper stop paging at posts saved by earlier processes too
+        self.scraper.mark_seen(self._seen_urls)
         logger.info(
             "Initialized ScrapeAndClassify pipeline (search='%s', model='%s')",
             self.scraper.search_text,
@@ -48,11 +82,16 @@ class ScrapeAndClassify:
         )
 
     def scrape_jobs(self) -> List[Dict[str, str]]:
-        """Scrape LinkedIn posts using the configured scraper."""
+        """Scrape LinkedIn posts using the configured scraper, skipping already saved URLs."""
         logger.info("Starting LinkedIn scrape run")
         posts = self.scraper.run()
-        logger.info("Scrape completed; retrieved %s posts", len(posts))
-        return posts
+        new_posts = [post for post in posts if post["url"] not in self._seen_urls]
+        logger.info(
+            "Scrape completed; retrieved %s posts (%s already saved)",
+            len(posts),
+            len(posts) - len(new_posts),
+        )
+        return new_posts
 
     def classify_jobs(
         self,
@@ -65,15 +104,16 @@ class ScrapeAndClassify:
             return posts or []
 
         logger.info("Classifying %s posts for hiring intent", len(posts))
-        logger.debug("Sleeping 10 seconds before hiring classification to throttle requests")
-        time.sleep(10)
-        for index, post in tqdm(
-            enumerate(posts), total=len(posts), desc="Classifying jobs"
-        ):
-            result = self.ollama_model_setup.inference(
-                input=post["content"], prompt=prompt, format=HiringPost
+        labels = asyncio.run(
+            self._classify_in_batches(
+                inputs=[post["content"] for post in posts],
+                prompt=prompt,
+                fmt=HiringPostBatch,
+                desc="Classifying jobs",
             )
-            posts[index]["hiring_post"] = result.classification
+        )
+        for post, label in zip(posts, labels):
+            post["hiring_post"] = label
         logger.info("Hiring classification complete")
         return posts
 
@@ -88,42 +128,363 @@ class ScrapeAndClassify:
             return posts or []
 
         logger.info("Classifying profile names for %s posts", len(posts))
-        logger.debug("Sleeping 10 seconds before name classification to throttle requests")
-        time.sleep(10)
-        for index, post in tqdm(
-            enumerate(posts), total=len(posts), desc="Classifying names"
-        ):
-            result = self.ollama_model_setup.inference(
-                input=post["profile_name"], prompt=prompt, format=NamesClassification
+        labels = asyncio.run(
+            self._classify_in_batches(
+                inputs=[post["profile_name"] for post in posts],
+                prompt=prompt,
+                fmt=NamesClassificationBatch,
+                desc="Classifying names",
             )
-            posts[index]["names_classification"] = result.classification
+        )
+        for post, label in zip(posts, labels):
+            post["names_classification"] = label
         logger.info("Name classification complete")
         return posts
 
-    def save_posts_to_csv(self, posts: Optional[List[Dict[str, str]]] = None) -> pd.DataFrame:
-        """Persist processed posts to disk by appending to the CSV if it exists."""
+    async def _classify_in_batches(
+        self,
+        inputs: List[str],
+        prompt: str,
+        fmt: Type[BaseModel],
+        desc: Optional[str] = None,
+        client: Optional[AsyncClient] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[Optional[int]]:
+        """
+        Classify inputs in groups of `BATCH_SIZE`, one chat request per group.
+
+        Inputs already known to the model setup's cache (or short-circuited by
+        its keyword pre-filter) are resolved without a request, and duplicate
+        inputs are sent only once. The rest are sent as numbered lists so the
+        system prompt and HTTP round-trip are paid once per group rather than
+        once per input. Groups whose answer is not valid JSON or does not
+        contain exactly one label per entry, and groups of a single input, are
+        classified one input per request on the model setup's binary fast
+        path. Labels are returned in input order.
+
+        A fresh `AsyncClient` is opened when `client` is not given, and a
+        fresh `OLLAMA_NUM_PARALLEL` semaphore when `semaphore` is not given;
+        callers running several classifications at once pass one shared
+        semaphore so the cap holds across all of them. A progress bar is shown
+        only when `desc` is given.
+        """
+        if client is None:
+            async with AsyncClient() as client:
+                return await self._classify_in_batches(inputs, prompt, fmt, desc, client, semaphore)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+
+        labels: List[Optional[int]] = [None] * len(inputs)
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(inputs):
+            label = self.ollama_model_setup.lookup(text, prompt, fmt)
+            if label is None:
+                pending.setdefault(text, []).append(index)
+            else:
+                labels[index] = label
+        if not pending:
+            return labels
+
+        texts = list(pending)
+        groups = list(_chunked(range(len(texts)), BATCH_SIZE))
+        # A lone input gains nothing from the batch format, so it goes
+        # straight to the single-label fast path with the retried ones
+        single = [group[0] for group in groups if len(group) == 1]
+        groups = [group for group in groups if len(group) > 1]
+
+        text_labels: List[Optional[int]] = [None] * len(texts)
+        if groups:
+            results = await self._classify_concurrently(
+                client=client,
+                inputs=[_format_batch([texts[index] for index in group]) for group in groups],
+                prompt=prompt,
+                fmt=fmt,
+                semaphore=semaphore,
+                desc=desc,
+            )
+            for group, result in zip(groups, results):
+                if result is None:
+                    logger.warning("Batch of %s inputs returned malformed JSON; retrying individually", len(group))
+                    single.extend(group)
+                    continue
+                if len(result.classifications) != len(group):
+                    logger.warning(
+                        "Batch of %s inputs returned %s classifications; retrying individually",
+                        len(group),
+                        len(result.classifications),
+                    )
+                    single.extend(group)
+                    continue
+                for index, label in zip(group, result.classifications):
+                    text_labels[index] = label
+
+        if single:
+            results = await self._classify_concurrently(
+                client=client,
+                inputs=[_format_batch([texts[index]]) for index in single],
+                prompt=prompt,
+                fmt=fmt,
+                semaphore=semaphore,
+                desc=desc and f"{desc} (single)",
+                binary=True,
+            )
+            for index, label in zip(single, results):
+                text_labels[index] = label
+
+        for text, label in zip(texts, text_labels):
+            if label is not None:
+                self.ollama_model_setup.remember(text, prompt, fmt, label)
+            for index in pending[text]:
+                labels[index] = label
+        return labels
+
+    async def _classify_concurrently(
+        self,
+        client: AsyncClient,
+        inputs: List[str],
+        prompt: str,
+        fmt: Type[BaseModel],
+        semaphore: asyncio.Semaphore,
+        desc: Optional[str] = None,
+        binary: bool = False,
+    ) -> List[Union[BaseModel, Optional[int]]]:
+        """
+        Run one classification request per input concurrently.
+
+        Requests are issued on the given `AsyncClient` and each holds
+        `semaphore` while in flight; sized to `OLLAMA_NUM_PARALLEL` and shared
+        by every concurrent caller, it keeps the server from being handed more
+        work than it has parallel slots for. Results are returned in input order:
+        parsed `fmt` models, or bare labels from the binary fast path when
+        `binary` is set. A reply that does not validate against `fmt` (for
+        example JSON truncated at the token cap) yields None for its input
+        instead of failing the whole call.
+        """
+        results: List[Union[BaseModel, Optional[int]]] = [None] * len(inputs)
+
+        async def classify(index: int, text: str):
+            async with semaphore:
+                if binary:
+                    return index, await self.ollama_model_setup._aclassify_binary(client, text, prompt)
+                try:
+                    return index, await self.ollama_model_setup._ainfer(client, text, prompt, fmt)
+                except ValidationError as e:
+                    logger.debug("Reply did not validate as %s: %s", fmt.__name__, e)
+                    return index, None
+
+        tasks = [classify(index, text) for index, text in enumerate(inputs)]
+        for future in tqdm(
+            asyncio.as_completed(tasks),
+            total=len(tasks),
+            desc=desc,
+            disable=desc is None,
+            miniters=max(1, len(tasks) // 100),
+            mininterval=0.5,
+            smoothing=0,
+        ):
+            index, result = await future
+            results[index] = result
+        return results
+
+    def run_iteration(self) -> int:
+        """
+        Scrape, classify and save posts as one streaming pipeline.
+
+        Scraped posts are grouped into batches of `BATCH_SIZE` and passed
+        through a bounded queue to classification workers and on to a CSV
+        writer. Each worker runs the hiring and profile-name classifications
+        of a batch concurrently, since neither depends on the other.
+        Classification starts while the page is still being extracted,
+        results reach disk batch by batch, and only a few batches are held in
+        memory at any time.
+
+        Returns:
+            int: Number of posts saved
+        """
+        return asyncio.run(self._stream_pipeline())
+
+    async def _stream_pipeline(self) -> int:
+        """Run the producer, classifier and writer tasks of `run_iteration`."""
+        # Each worker keeps two requests in flight, one per classification;
+        # the shared semaphore caps the total however the work is split
+        workers = max(1, OLLAMA_NUM_PARALLEL // 2)
+        semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+        posts_queue: asyncio.Queue = asyncio.Queue(maxsize=OLLAMA_NUM_PARALLEL)
+        results_queue: asyncio.Queue = asyncio.Queue(maxsize=OLLAMA_NUM_PARALLEL)
+
+        async def produce() -> None:
+            batch: List[Dict[str, str]] = []
+            async for post in self.scraper.stream():
+                if post["url"] in self._seen_urls:
+                    logger.debug("Skipping already saved post %s", post["url"])
+                    continue
+                batch.append(post)
+                if len(batch) == BATCH_SIZE:
+                    await posts_queue.put(batch)
+                    batch = []
+            if batch:
+                await posts_queue.put(batch)
+            for _ in range(workers):
+                await posts_queue.put(None)
+
+        async def classify_worker(client: AsyncClient) -> None:
+            while (batch := await posts_queue.get()) is not None:
+                hiring_labels, name_labels = await asyncio.gather(
+                    self._classify_in_batches(
+                        inputs=[post["content"] for post in batch],
+                        prompt=PROMPT_HIRING_POST,
+                        fmt=HiringPostBatch,
+                        client=client,
+                        semaphore=semaphore,
+                    ),
+                    self._classify_in_batches(
+                        inputs=[post["profile_name"] for post in batch],
+                        prompt=PROMPT_NAMES_CLASSIFICATION,
+                        fmt=NamesClassificationBatch,
+                        client=client,
+                        semaphore=semaphore,
+                    ),
+                )
+                for post, hiring_label, name_label in zip(batch, hiring_labels, name_labels):
+                    post["hiring_post"] = hiring_label
+                    post["names_classification"] = name_label
+                await results_queue.put(batch)
+
+        async def classify(client: AsyncClient) -> None:
+            await asyncio.gather(*(classify_worker(client) for _ in range(workers)))
+            await results_queue.put(None)
+
+        async def write() -> int:
+            saved = 0
+            with tqdm(desc="Processing posts", unit="post", mininterval=0.5, smoothing=0) as progress:
+                while (batch := await results_queue.get()) is not None:
+                    # Off the event loop, so classification continues during disk I/O
+                    saved += await asyncio.to_thread(self.save_posts_to_csv, batch)
+                    progress.update(len(batch))
+            return saved
+
+        async with AsyncClient() as client:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                group.create_task(classify(client))
+                writer = group.create_task(write())
+        return writer.result()
+
+    def save_posts_to_csv(self, posts: Optional[List[Dict[str, str]]] = None) -> int:
+        """
+        Persist processed posts to disk by appending them to the CSV.
+
+        A failed write raises, so it is never counted as saved.
+
+        Returns:
+            int: Number of rows written
+        """
         if not posts:
             logger.warning("No posts provided for CSV export")
-            return pd.DataFrame()
+            return 0
+
+        return self._append_to_csv(posts)
+
+    def _append_to_csv(self, posts: List[Dict[str, str]]) -> int:
+        """
+        Append posts to the output CSV.
 
-        df_new = pd.DataFrame(posts)
+        Only the new rows are written; the header is written when the file is
+        created and reused as-is afterwards, so the cost of a save does not
+        grow with the size of the existing file. If the posts carry columns
+        the existing header lacks (e.g. a file written by an older version),
+        the file is rewritten once with the extended header rather than
+        dropping those values. Errors are logged and re-raised, so the
+        caller waiting on the write learns that it failed.
+
+        Returns:
+            int: Number of rows written
+        """
         try:
-            if os.path.exists(OUTPUT_CSV_FILENAME):
-                df_existing = pd.read_csv(OUTPUT_CSV_FILENAME)
-                df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                df_combined.to_csv(OUTPUT_CSV_FILENAME, index=False)
-                logger.info("Appended %s posts to %s (total now %s)", len(df_new), OUTPUT_CSV_FILENAME, len(df_combined))
-                return df_combined
+            file_exists = os.path.exists(OUTPUT_CSV_FILENAME) and os.path.getsize(OUTPUT_CSV_FILENAME) > 0
+            row_keys = list(dict.fromkeys(key for post in posts for key in post))
+            if file_exists:
+                with open(OUTPUT_CSV_FILENAME, newline="", encoding="utf-8") as csv_file:
+                    fieldnames = next(csv.reader(csv_file))
+                missing = [key for key in row_keys if key not in fieldnames]
+                if missing:
+                    logger.warning(
+                        "%s lacks columns %s; rewriting it with the extended header",
+                        OUTPUT_CSV_FILENAME,
+                        missing,
+                    )
+                    fieldnames = self._extend_csv_header(fieldnames + missing)
             else:
-                df_new.to_csv(OUTPUT_CSV_FILENAME, index=False)
-                logger.info("Saved %s posts to %s", len(df_new), OUTPUT_CSV_FILENAME)
-                return df_new
+                fieldnames = row_keys
+
+            with open(OUTPUT_CSV_FILENAME, "a", newline="", encoding="utf-8") as csv_file:
+                writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+                if not file_exists:
+                    writer.writeheader()
+                writer.writerows(posts)
+            urls = [post["url"] for post in posts]
+            self._seen_urls.update(urls)
+            self.scraper.mark_seen(urls)
+            logger.info("Appended %s posts to %s", len(posts), OUTPUT_CSV_FILENAME)
+            return len(posts)
         except Exception as e:
             logger.error("Failed to save to CSV: %s", str(e))
-            return df_new
+            raise
+
+    @staticmethod
+    def _extend_csv_header(fieldnames: List[str]) -> List[str]:
+        """
+        Rewrite the output CSV with `fieldnames` as its header.
+
+        Existing rows are kept and left empty in the new columns. The file is
+        written next to the original and swapped in, so a failed rewrite
+        leaves the original untouched.
+
+        Returns:
+            List[str]: The new header
+        """
+        tmp_filename = f"{OUTPUT_CSV_FILENAME}.tmp"
+        with open(OUTPUT_CSV_FILENAME, newline="", encoding="utf-8") as src_file, open(
+            tmp_filename, "w", newline="", encoding="utf-8"
+        ) as tmp_file:
+            writer = csv.DictWriter(tmp_file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(csv.DictReader(src_file))
+        os.replace(tmp_filename, OUTPUT_CSV_FILENAME)
+        return fieldnames
+
+    @staticmethod
+    def _load_seen_urls() -> set[str]:
+        """Read the URLs already saved to the output CSV, without loading the other columns into memory."""
+        if not os.path.exists(OUTPUT_CSV_FILENAME):
+            return set()
+        try:
+            with open(OUTPUT_CSV_FILENAME, newline="", encoding="utf-8") as csv_file:
+                seen_urls = {row["url"] for row in csv.DictReader(csv_file) if row.get("url")}
+        except Exception as e:
+            logger.error("Failed to read saved URLs from %s: %s", OUTPUT_CSV_FILENAME, str(e))
+            return set()
+        logger.info("Loaded %s already saved post URLs from %s", len(seen_urls), OUTPUT_CSV_FILENAME)
+        return seen_urls
+
+    def load_all(self) -> "pd.DataFrame":
+        """Load every post saved so far from the output CSV as a DataFrame, for interactive use."""
+        pd = _get_pd()
+        if not os.path.exists(OUTPUT_CSV_FILENAME):
+            return pd.DataFrame()
+        return pd.read_csv(OUTPUT_CSV_FILENAME)
 
     def shutdown(self) -> None:
         """Release underlying resources."""
+        setup = self.ollama_model_setup
+        lookups = setup.cache_hits + setup.cache_misses + setup.prefilter_skips
+        logger.info(
+            "Inference cache stats: %s hits, %s misses, %s keyword pre-filter skips (%.0f%% of lookups bypassed the model)",
+            setup.cache_hits,
+            setup.cache_misses,
+            setup.prefilter_skips,
+            100 * (setup.cache_hits + setup.prefilter_skips) / lookups if lookups else 0,
+        )
         logger.debug("Shutting down scraper resources")
         self.scraper.close()
 
@@ -134,7 +495,7 @@ def run_pipeline(
     search_text: Optional[str],
     max_scroll_attempts: Optional[int],
     interval_hours: Optional[float]
-) -> pd.DataFrame:
+) -> None:
     """
     Execute the scrape and classification pipeline end-to-end in a loop.
     
@@ -154,46 +515,66 @@ def run_pipeline(
     )
     
     # Convert hours to seconds
-    INTERVAL_SECONDS = int(interval_hours * 3600)
+    INTERVAL_SECONDS = interval_hours * 3600
     
+    # The first Ctrl+C lets the running iteration finish and save its posts;
+    # a second one aborts immediately.
+    stop = threading.Event()
+
+    def request_stop(signum, frame) -> None:
+        if stop.is_set():
+            raise KeyboardInterrupt
+        logger.info("Stop requested; finishing current iteration (press Ctrl+C again to abort)")
+        stop.set()
+
+    previous_handler = signal.signal(signal.SIGINT, request_stop)
+
     try:
         iteration = 0
-        while True:
+        # Iterations start on a fixed schedule measured from the start of the
+        # previous one, so the time an iteration takes is not added on top of
+        # the interval. An overrunning iteration is followed immediately by a
+        # single catch-up run; missed runs are coalesced, never stacked.
+        next_run = time.monotonic()
+        while not stop.is_set():
             iteration += 1
+            next_run += INTERVAL_SECONDS
             logger.info("=" * 80)
             logger.info("Starting pipeline iteration #%s", iteration)
             logger.info("=" * 80)
             
             try:
-                posts = pipeline.scrape_jobs()
-                if posts:
-                    posts = pipeline.classify_jobs(posts=posts, prompt=PROMPT_HIRING_POST)
-                    # posts = pipeline.classify_names(posts=posts, prompt=PROMPT_NAMES_CLASSIFICATION)
-                    pipeline.save_posts_to_csv(posts=posts)
-                    logger.info("Iteration #%s completed successfully. Collected %s posts", iteration, len(posts))
+                saved = pipeline.run_iteration()
+                if saved:
+                    logger.info("Iteration #%s completed successfully. Collected %s posts", iteration, saved)
                 else:
                     logger.warning("Iteration #%s completed but no posts were collected", iteration)
             except Exception as e:
                 logger.error("Error during iteration #%s: %s", iteration, e, exc_info=True)
-            
-            logger.info("Waiting %.1f hour(s) (%.0f minutes) until next iteration... (Press Ctrl+C to stop)", 
-                       interval_hours, interval_hours * 60)
-            
-            # Wait for specified interval before next iteration
-            # Sleep in smaller chunks to allow faster interrupt response
-            sleep_chunks = max(60, int(INTERVAL_SECONDS / 60))  # Check every minute, or adjust if interval is less than 1 hour
-            chunk_duration = INTERVAL_SECONDS / sleep_chunks
-            for i in range(sleep_chunks):
-                time.sleep(chunk_duration)
-                if i % 10 == 0:  # Log every 10 minutes
-                    remaining_minutes = (sleep_chunks - i - 1) * (chunk_duration / 60)
-                    logger.debug("Waiting... %d minutes remaining until next run", int(remaining_minutes))
-        
+
+            if stop.is_set():
+                break
+            delay = next_run - time.monotonic()
+            if delay <= 0:
+                logger.warning(
+                    "Iteration #%s overran the %.1f hour interval by %.0f seconds; starting the next one now",
+                    iteration, interval_hours, -delay,
+                )
+                next_run = time.monotonic()
+                continue
+            logger.info("Waiting %.0f minutes until next iteration... (Press Ctrl+C to stop)", delay / 60)
+            # Returns as soon as Ctrl+C sets the event, so no polling is needed
+            stop.wait(delay)
+
+        logger.info("=" * 80)
+        logger.info("Stop requested. Shutting down gracefully...")
+        logger.info("=" * 80)
     except KeyboardInterrupt:
         logger.info("\n" + "=" * 80)
         logger.info("Keyboard interrupt received. Shutting down gracefully...")
         logger.info("=" * 80)
     finally:
+        signal.signal(signal.SIGINT, previous_handler)
         pipeline.shutdown()
         logger.info("Pipeline shutdown complete")
 
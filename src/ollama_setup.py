@@ -1,21 +1,82 @@
+import functools
+import hashlib
 import logging
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+from collections import OrderedDict
 
-from ollama import chat
-from pydantic import BaseModel
-from typing import Type
+from ollama import AsyncClient, Client
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, Dict, Optional, Tuple, Type
+
+from src.config.settings import (
+    INDIAN_CITIES_RE,
+    INFERENCE_CACHE_SIZE,
+    JOB_KEYWORDS_RE,
+    KEYWORD_PREFILTER_MIN_LENGTH,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_NUM_CTX,
+    OLLAMA_NUM_PREDICT,
+)
+from src.dataclass import HiringPost, HiringPostBatch
 
 logger = logging.getLogger(__name__)
 
+OLLAMA_INSTALL_SCRIPT_URL = "https://ollama.com/install.sh"
+
+# The binary fast path ends its prompt with the opening of the JSON answer the
+# classification prompts ask for, so the model only has to emit the label.
+BINARY_ANSWER_PREFIX = 'Answer: {"classifications": ['
+# The label must be the first thing the model emits after the prefix; a reply
+# that starts with anything else (e.g. an echoed "[0] ...") has no label.
+_BINARY_LABEL_RE = re.compile(r"\s*([01])(?![0-9])")
+
+# Result of the first check_device_usage call in this process.
+_DEVICE_INFO_CACHE: str | None = None
+
+
+@functools.cache
+def _os_name() -> str:
+    """Return the lower-cased operating system name, detected once per process."""
+    return platform.system().lower()
+
+
+@functools.cache
+def _have_ollama() -> bool:
+    """Return whether the ollama binary is on PATH, checked once per process."""
+    return shutil.which("ollama") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_for(fmt: Type[BaseModel]) -> Dict[str, Any]:
+    """Return the JSON schema of a response model, built once per class."""
+    return fmt.model_json_schema()
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter_for(fmt: Type[BaseModel]) -> TypeAdapter:
+    """Return a validator for a response model, built once per class."""
+    return TypeAdapter(fmt)
+
+
 
 class OllamaModelSetup:
+    # Models confirmed available in this process, shared by all instances.
+    _pulled: set[str] = set()
+
     def __init__(self, model_name: str):
         logger.info("Initializing Ollama model setup for '%s'", model_name)
         self.model_name = model_name
+        self._client = Client()
+        self._cache: "OrderedDict[Tuple[str, str, str], int]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.prefilter_skips = 0
         self._install_ollama()
         self._pull_model(self.model_name)
         self.device_info = self.check_device_usage()
@@ -23,17 +84,17 @@ class OllamaModelSetup:
     
     def _install_ollama(self):
         """Detect OS and install Ollama if not already installed."""
-        if shutil.which("ollama"):
+        if _have_ollama():
             logger.info("Ollama is already installed")
             return
-        system = platform.system().lower()
+        system = _os_name()
         logger.info("Detected operating system: %s", system)
         if system == "darwin":  # macOS
             logger.info("Installing Ollama for macOS")
-            subprocess.run(["/bin/bash", "-c", "$(curl -fsSL https://ollama.com/install.sh)"], check=True)
+            subprocess.run(["/bin/bash", "-c", f"$(curl -fsSL {OLLAMA_INSTALL_SCRIPT_URL})"], check=True)
         elif system == "linux":
             logger.info("Installing Ollama for Linux")
-            subprocess.run(["curl", "-fsSL", "https://ollama.com/install.sh", "|", "sh"], shell=True, check=True)
+            self._run_install_script()
         elif system == "windows":
             ollama_url = "https://ollama.com/download/windows"
             logger.error("Windows installation is manual. Download from %s", ollama_url)
@@ -41,25 +102,78 @@ class OllamaModelSetup:
         else:
             logger.error("Unsupported operating system: %s", system)
             raise OSError("Unsupported operating system.")
+        # The cached PATH lookup predates the install
+        _have_ollama.cache_clear()
+
+    def _run_install_script(self):
+        """
+        Download the official install script once and run it with `sh`.
+
+        If `OLLAMA_INSTALL_SHA256` is set, the downloaded script must match
+        that checksum before it is executed.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            script_path = os.path.join(tmp_dir, "install.sh")
+            subprocess.run(["curl", "-fsSL", "-o", script_path, OLLAMA_INSTALL_SCRIPT_URL], check=True)
+            expected_sha256 = os.getenv("OLLAMA_INSTALL_SHA256")
+            if expected_sha256:
+                with open(script_path, "rb") as script:
+                    actual_sha256 = hashlib.sha256(script.read()).hexdigest()
+                if actual_sha256 != expected_sha256.strip().lower():
+                    logger.error(
+                        "Ollama install script checksum mismatch (expected %s, got %s)",
+                        expected_sha256,
+                        actual_sha256,
+                    )
+                    sys.exit(1)
+            subprocess.run(["sh", script_path], check=True)
 
     def _pull_model(self, model_name):
-        """Pull the specified model."""
+        """Pull the specified model unless it is already available locally."""
+        if model_name in OllamaModelSetup._pulled:
+            logger.debug("Model '%s' already ensured in this process", model_name)
+            return
         logger.info("Ensuring Ollama model '%s' is available", model_name)
+        if self._is_model_local(model_name):
+            logger.info("Model '%s' is already available", model_name)
+            OllamaModelSetup._pulled.add(model_name)
+            return
         result = subprocess.run(["ollama", "pull", model_name], capture_output=True, text=True)
         if result.returncode == 0:
             logger.info("Model '%s' downloaded successfully", model_name)
+            OllamaModelSetup._pulled.add(model_name)
         else:
             logger.error("Failed to download model '%s': %s", model_name, result.stderr.strip())
             sys.exit(1)
 
+    @staticmethod
+    def _is_model_local(model_name: str) -> bool:
+        """Check `ollama list` for the model without contacting the registry."""
+        try:
+            result = subprocess.run(["ollama", "list"], capture_output=True, text=True, timeout=3)
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            logger.debug("Could not check ollama list: %s", e)
+            return False
+        if result.returncode != 0:
+            return False
+        names = {line.split()[0] for line in result.stdout.splitlines()[1:] if line.strip()}
+        return model_name in names or f"{model_name}:latest" in names
+
     def check_device_usage(self) -> str:
         """
         Check if Ollama is using CPU or GPU for inference.
+
+        The result is cached for the lifetime of the process, so repeated
+        setups do not spawn the probes again.
         
         Returns:
             str: Device usage information (e.g., "GPU (CUDA)", "GPU (Metal)", "CPU", "Unknown")
         """
-        system = platform.system().lower()
+        global _DEVICE_INFO_CACHE
+        if _DEVICE_INFO_CACHE:
+            return _DEVICE_INFO_CACHE
+
+        system = _os_name()
         device_info = "Unknown"
         
         # Method 1: Check ollama ps for running models
@@ -85,53 +199,24 @@ class OllamaModelSetup:
         # Method 2: Check for GPU availability based on OS
         if device_info == "Unknown":
             if system == "linux":
-                # Check for NVIDIA GPU
-                try:
-                    result = subprocess.run(
-                        ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
-                        capture_output=True,
-                        text=True,
-                        timeout=3
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        gpu_name = result.stdout.strip().split("\n")[0]
-                        logger.info("Detected NVIDIA GPU: %s", gpu_name)
-                        device_info = "GPU (CUDA) - Available"
-                except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                    pass
-                
-                # Check for AMD GPU (ROCm)
-                try:
-                    result = subprocess.run(
-                        ["rocm-smi", "--showid"],
-                        capture_output=True,
-                        text=True,
-                        timeout=3
-                    )
-                    if result.returncode == 0:
-                        logger.info("Detected AMD GPU (ROCm)")
-                        device_info = "GPU (ROCm) - Available"
-                except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                    pass
-                    
+                # Check for NVIDIA GPU via the kernel driver instead of spawning nvidia-smi
+                if os.path.exists("/proc/driver/nvidia/version"):
+                    logger.info("Detected NVIDIA GPU driver")
+                    device_info = "GPU (CUDA) - Available"
+
+                # Check for AMD GPU (ROCm) via the ROCm kernel device instead of spawning rocm-smi
+                if os.path.exists("/dev/kfd"):
+                    logger.info("Detected AMD GPU (ROCm)")
+                    device_info = "GPU (ROCm) - Available"
+
             elif system == "darwin":  # macOS
-                # Check for Metal support (Apple Silicon or AMD GPUs)
-                try:
-                    result = subprocess.run(
-                        ["system_profiler", "SPDisplaysDataType"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if result.returncode == 0:
-                        output = result.stdout.lower()
-                        if "apple" in output or "metal" in output or "m1" in output or "m2" in output or "m3" in output:
-                            device_info = "GPU (Metal) - Available"
-                        else:
-                            device_info = "CPU - No Metal GPU detected"
-                except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                    pass
-                    
+                # Ollama uses Metal on Apple Silicon only; the CPU architecture is
+                # enough to tell, without a multi-second system_profiler call
+                if platform.machine() == "arm64" or platform.processor().startswith("arm"):
+                    device_info = "GPU (Metal) - Available"
+                else:
+                    device_info = "CPU - No Metal GPU detected"
+
             elif system == "windows":
                 # On Windows, GPU is typically available if CUDA drivers are installed
                 # We can't easily detect without additional tools
@@ -151,6 +236,7 @@ class OllamaModelSetup:
         if device_info == "Unknown":
             device_info = "CPU - Unable to detect GPU (likely using CPU)"
         
+        _DEVICE_INFO_CACHE = device_info
         return device_info
 
     def get_device_info(self) -> str:
@@ -166,6 +252,49 @@ class OllamaModelSetup:
         self.device_info = self.check_device_usage()
         return self.device_info
 
+    def lookup(self, input: str, prompt: str, format: Type[BaseModel]) -> Optional[int]:
+        """
+        Return a known classification for the input without calling the model.
+
+        Hiring-classification inputs that mention both a job keyword and an
+        Indian city are labelled 1 outright, and long ones that mention
+        neither are labelled 0; otherwise the LRU cache of earlier results is
+        consulted.
+
+        Args:
+            input: The input text to classify
+            prompt: The prompt the classification is requested with
+            format: The Pydantic model the classification is requested with
+        Returns:
+            Optional[int]: The classification, or None if the model must be called
+        """
+        if issubclass(format, (HiringPost, HiringPostBatch)):
+            has_keyword = JOB_KEYWORDS_RE.search(input) is not None
+            has_city = INDIAN_CITIES_RE.search(input) is not None
+            if has_keyword and has_city:
+                self.prefilter_skips += 1
+                return 1
+            if not has_keyword and not has_city and len(input) >= KEYWORD_PREFILTER_MIN_LENGTH:
+                self.prefilter_skips += 1
+                return 0
+
+        key = (prompt, input, format.__name__)
+        label = self._cache.get(key)
+        if label is None:
+            self.cache_misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        return label
+
+    def remember(self, input: str, prompt: str, format: Type[BaseModel], label: int) -> None:
+        """Store a model classification so later `lookup` calls can reuse it."""
+        key = (prompt, input, format.__name__)
+        self._cache[key] = label
+        self._cache.move_to_end(key)
+        if len(self._cache) > INFERENCE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
     def inference(self, input: str = None, prompt: str = None, format: Type[BaseModel] = None) -> BaseModel | None:
         """
         Run inference with the specified model and format.
@@ -180,18 +309,121 @@ class OllamaModelSetup:
         if not input or not prompt or not format:
             raise ValueError("Input and format are required.")
         logger.debug("Running inference with model '%s'", self.model_name)
-        messages = [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": input}
-        ]
-        response = chat(
-            model=self.model_name,
-            messages=messages,
-            format=format.model_json_schema(),
-        )
-        response = format.model_validate_json(response.message.content)
+        response = self._client.chat(**self._chat_request(input, prompt, format))
+        response = _adapter_for(format).validate_json(response.message.content)
         return response
 
+    async def _ainfer(
+        self,
+        client: AsyncClient,
+        input: str,
+        prompt: str,
+        fmt: Type[BaseModel],
+    ) -> BaseModel:
+        """
+        Asynchronous counterpart of `inference` using a shared `AsyncClient`.
+
+        Args:
+            client: The async Ollama client to issue the request on
+            input: The input text to classify
+            prompt: The prompt to use for the inference
+            fmt: The Pydantic model to use for the inference
+        Returns:
+            BaseModel: The inference result
+        """
+        if not input or not prompt or not fmt:
+            raise ValueError("Input and format are required.")
+        logger.debug("Running async inference with model '%s'", self.model_name)
+        response = await client.chat(**self._chat_request(input, prompt, fmt))
+        return _adapter_for(fmt).validate_json(response.message.content)
+
+    def classify_binary(self, text: str, system: str) -> Optional[int]:
+        """
+        Classify a single input with a 0/1 label using `generate`.
+
+        Skips the chat template and the JSON-schema constrained decoder: the
+        prompt is sent raw and already ends with the opening of the JSON
+        answer, so the model continues it directly, decoding stops at the
+        first closing bracket and the label is parsed from the few generated
+        tokens.
+
+        Args:
+            text: The input text to classify
+            system: The classification prompt
+        Returns:
+            Optional[int]: The label, or None if the model did not produce one
+        """
+        if not text or not system:
+            raise ValueError("Input and prompt are required.")
+        logger.debug("Running binary classification with model '%s'", self.model_name)
+        response = self._client.generate(**self._generate_request(text, system))
+        return self._parse_binary(response.response)
+
+    async def _aclassify_binary(self, client: AsyncClient, text: str, system: str) -> Optional[int]:
+        """Asynchronous counterpart of `classify_binary` using a shared `AsyncClient`."""
+        if not text or not system:
+            raise ValueError("Input and prompt are required.")
+        logger.debug("Running async binary classification with model '%s'", self.model_name)
+        response = await client.generate(**self._generate_request(text, system))
+        return self._parse_binary(response.response)
+
+    def _generate_request(self, text: str, system: str) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for a binary fast-path `generate` call.
+
+        With `raw` set Ollama applies no template and ignores `system`, so the
+        classification prompt, the input and the answer prefix are joined by
+        hand into the full text the model continues.
+        """
+        return {
+            "model": self.model_name,
+            "prompt": f"{system}\n\n{text}\n\n{BINARY_ANSWER_PREFIX}",
+            "raw": True,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": {
+                "num_ctx": OLLAMA_NUM_CTX,
+                "num_predict": 8,
+                "temperature": 0,
+                "stop": ["]", "}"],
+            },
+        }
+
+    @staticmethod
+    def _parse_binary(output: str) -> Optional[int]:
+        """Return the 0/1 label a fast-path completion starts with."""
+        match = _BINARY_LABEL_RE.match(output)
+        if match is None:
+            logger.warning("No binary label in model output: %r", output)
+            return None
+        return int(match.group(1))
+
+    def _chat_request(self, input: str, prompt: str, fmt: Type[BaseModel]) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for a classification `chat` call.
+
+        `keep_alive` keeps the model resident between requests and across the
+        wait between pipeline iterations, so no call pays a model reload. The
+        answer is a short schema-constrained JSON object, so thinking is
+        disabled, decoding is greedy and the output is capped at
+        `OLLAMA_NUM_PREDICT` tokens.
+        """
+        return {
+            "model": self.model_name,
+            "messages": [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": input}
+            ],
+            "format": _schema_for(fmt),
+            "think": False,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": {
+                "num_ctx": OLLAMA_NUM_CTX,
+                "num_predict": OLLAMA_NUM_PREDICT,
+                "temperature": 0,
+                "top_p": 1.0,
+            },
+        }
+
 if __name__ == "__main__":
     # Configure logging when running directly
     from src.config.settings import configure_logging
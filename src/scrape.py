@@ -3,34 +3,100 @@ LinkedIn Job Scraper Module.
 
 This module provides functionality to scrape job postings from LinkedIn
 by searching posts, extracting relevant job information, and saving to CSV.
+
+Posts are fetched from LinkedIn's Voyager JSON API using the session cookies
+of a one-time browser login; the Selenium DOM scraping path is kept as a
+fallback for when the API is unavailable.
 """
 
+import asyncio
+import copy
+import json
 import logging
+import sys
+import threading
+from itertools import islice
+from urllib.parse import quote
+
+import httpx
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    TimeoutException,
+    WebDriverException,
+)
 import time
 import random
 import csv
 import os
 import re
-from typing import Optional, Dict, List
+from typing import AsyncIterator, Callable, Optional, Dict, Iterable, Iterator, List, TextIO
 from src.config.settings import (
+    CSV_BUFFER_SIZE,
+    CSV_FIELDNAMES,
+    CSV_FLUSH_ROWS,
+    HEADLESS_BROWSER,
+    LINKEDIN_COOKIES_PATH,
     MAX_SCROLL_ATTEMPTS,
     MIN_SLEEP_TIME,
     MAX_SLEEP_TIME,
     WEBDRIVER_WAIT_TIMEOUT,
     RUN_INTERVAL,
-    INDIAN_CITIES,
+    SEARCH_CONCURRENCY,
+    SEARCH_TEXT,
+    SCRAPED_POSTS_CSV_FILENAME,
+    SCROLL_LOAD_TIMEOUT,
+    SCRAPE_JOB_POSTS_ONLY,
+    INDIAN_CITIES_RE,
     JOB_KEYWORDS,
+    JOB_KEYWORDS_RE,
 )
 
 # Constants
 LINKEDIN_LOGIN_URL = "https://www.linkedin.com/login"
+LINKEDIN_HOME_URL = "https://www.linkedin.com/"
+LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
 LINKEDIN_POST_BASE_URL = "https://www.linkedin.com/feed/update/"
+VOYAGER_GRAPHQL_URL = "https://www.linkedin.com/voyager/api/graphql"
+# LinkedIn rotates this id when the search query changes shape; update it
+# from a browser's network tab if the API starts returning 400s.
+VOYAGER_SEARCH_QUERY_ID = "voyagerSearchDashClusters.b0928897b71bd00a5a7291755dcd64f0"
+VOYAGER_PAGE_SIZE = 10
+# Firefox preferences for a text-only scraper: skip downloading images and web
+# fonts and never autoplay media. Stylesheets stay enabled because LinkedIn's
+# infinite scroll only loads more posts once the feed is laid out.
+FIREFOX_PREFERENCES = {
+    "permissions.default.image": 2,
+    "gfx.downloadable_fonts.enabled": False,
+    "media.autoplay.default": 5,
+}
+ACTIVITY_URN_PATTERN = re.compile(r"urn:li:activity:\d+")
+
+# Job post indicators used by LinkedInJobScraper.is_job_post. They expect
+# lowercased text and are compiled without re.IGNORECASE, which keeps the
+# regex engine's literal-prefix fast paths enabled.
+_RE_JOB_KEYWORDS = re.compile(JOB_KEYWORDS_RE.pattern)
+_RE_REQUIREMENTS = re.compile(r"requirements?|qualifications?")
+_RE_EXPERIENCE = re.compile(r"\d+\+?\s*years?|years? of experience")
+_RE_APPLY = re.compile(r"apply|send|email|dm|interested|opportunity")
+_RE_EXTRA = re.compile(r"resume|cv|position|role")
+_JOB_SIGNALS = {
+    "keyword": _RE_JOB_KEYWORDS,
+    "requirements": _RE_REQUIREMENTS,
+    "experience": _RE_EXPERIENCE,
+    "apply": _RE_APPLY,
+    "extra": _RE_EXTRA,
+}
+# Union of every signal above, so is_job_post can locate all of them in one
+# scan of the post instead of one scan per signal.
+_RE_JOB_SIGNALS = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in _JOB_SIGNALS.values())
+)
 
 # CSS/XPath Selectors
 SELECTORS = {
@@ -57,9 +123,123 @@ SELECTORS = {
     "post_actor_title": "span.update-components-actor__title",
 }
 
+# Reads the urn, content and author of a post element inside the browser;
+# fields missing from a post are returned as null.
+_POST_FIELDS_JS = """
+const postFields = (element, contentSelector, nameSelector) => ({
+    urn: element.getAttribute("data-urn"),
+    content: element.querySelector(contentSelector)?.innerText ?? null,
+    name: element.querySelector(nameSelector)?.innerText ?? null,
+});
+"""
+# Extracts every post on the page in a single WebDriver round-trip. Arguments
+# are SELECTORS["post_containers"], SELECTORS["post_content"] and
+# SELECTORS["post_actor_title"] and an optional case-insensitive keyword regex.
+# The first container selector that matches anything wins. With a regex, posts
+# whose text does not match it are skipped before their fields are read.
+EXTRACT_POSTS_SCRIPT = _POST_FIELDS_JS + """
+const [containerSelectors, contentSelector, nameSelector, keywordPattern] = arguments;
+const keywords = keywordPattern ? new RegExp(keywordPattern, "i") : null;
+for (const selector of containerSelectors) {
+    const elements = document.querySelectorAll(selector);
+    if (elements.length) {
+        return Array.from(elements)
+            .filter((element) => !keywords || keywords.test(element.textContent))
+            .map((element) => postFields(element, contentSelector, nameSelector));
+    }
+}
+return [];
+"""
+# Extracts a single post element in one round-trip. Arguments are the element,
+# SELECTORS["post_content"] and SELECTORS["post_actor_title"].
+EXTRACT_POST_SCRIPT = _POST_FIELDS_JS + """
+return postFields(...arguments);
+"""
+
 logger = logging.getLogger(__name__)
 
 
+class DriverPool:
+    """
+    Pool of logged-in WebDrivers kept alive across scrape runs.
+
+    Scrapers borrow a driver for one browser run and hand it back afterwards,
+    so at most `size` browsers are ever started and each logs in only once.
+    A driver is only ever used by one scraper at a time.
+    """
+
+    def __init__(self, size: int = SEARCH_CONCURRENCY):
+        """
+        Initialize an empty pool; drivers are started on demand.
+
+        Args:
+            size: Maximum number of drivers alive at once
+        """
+        self.size = size
+        # Used as a LIFO stack so the most recently used, warmest browser is
+        # handed out first
+        self._idle: List[webdriver.Firefox] = []
+        # Guards _idle and _created; notified whenever a driver is released
+        # or discarded, since either lets a waiting borrower proceed
+        self._available = threading.Condition()
+        self._created = 0
+
+    def acquire(self, create: Callable[[], webdriver.Firefox]) -> webdriver.Firefox:
+        """
+        Borrow an idle driver, starting one with `create` if the pool has room.
+
+        Blocks while all `size` drivers are in use, until one is released
+        or discarded.
+
+        Args:
+            create: Callable returning a new logged-in driver
+
+        Returns:
+            Firefox WebDriver instance
+        """
+        with self._available:
+            if not self._idle and self._created >= self.size:
+                logger.debug("All %s pooled drivers busy; waiting for one", self.size)
+                self._available.wait_for(lambda: self._idle or self._created < self.size)
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            return create()
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+
+    def release(self, driver: webdriver.Firefox) -> None:
+        """Return a borrowed driver to the pool."""
+        with self._available:
+            self._idle.append(driver)
+            self._available.notify()
+
+    def discard(self, driver: webdriver.Firefox) -> None:
+        """Quit a borrowed driver instead of returning it to the pool."""
+        logger.info("Closing WebDriver session")
+        try:
+            driver.quit()
+        except Exception:
+            # A crashed browser cannot be quit cleanly; it is dropped all the same
+            logger.debug("Could not quit WebDriver cleanly", exc_info=True)
+        finally:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+
+    def close(self) -> None:
+        """Quit every idle driver in the pool."""
+        with self._available:
+            drivers, self._idle = self._idle, []
+        for driver in drivers:
+            self.discard(driver)
+
+
 class LinkedInJobScraper:
     """
     A scraper for extracting job postings from LinkedIn.
@@ -73,9 +253,9 @@ class LinkedInJobScraper:
         password (str): LinkedIn password for authentication
         search_text (str): Search query text
         max_scroll_attempts (int): Maximum number of scroll attempts
-        driver (webdriver): Selenium WebDriver instance
+        driver (webdriver): Selenium WebDriver borrowed from the driver pool,
+            or None outside of a browser scrape run
         wait (WebDriverWait): WebDriverWait instance for explicit waits
-        indian_cities (set): Set of Indian city names for filtering
         job_keywords (list): List of regex patterns for job keywords
         job_pattern (Pattern): Compiled regex pattern for job detection
     """
@@ -99,30 +279,49 @@ class LinkedInJobScraper:
         self.email = email
         self.password = password
         self.search_text = search_text
-        # Ensure max_scroll_attempts is an integer
+        # Validated once here; everything downstream uses the attribute as is
         scroll_attempts = max_scroll_attempts if max_scroll_attempts is not None else MAX_SCROLL_ATTEMPTS
-        if not isinstance(scroll_attempts, int):
-            if isinstance(scroll_attempts, (tuple, list)) and len(scroll_attempts) == 1:
-                logger.warning("max_scroll_attempts is a sequence (%s), extracting first element", type(scroll_attempts).__name__)
-                scroll_attempts = int(scroll_attempts[0])
-            elif isinstance(scroll_attempts, (tuple, list)) and len(scroll_attempts) > 1:
-                logger.error("max_scroll_attempts is a sequence with multiple elements (%s), using first element", scroll_attempts)
-                scroll_attempts = int(scroll_attempts[0])
-            else:
-                try:
-                    logger.warning("max_scroll_attempts is not an integer (%s), converting to int", type(scroll_attempts).__name__)
-                    scroll_attempts = int(scroll_attempts)
-                except (ValueError, TypeError) as e:
-                    logger.error("Cannot convert max_scroll_attempts (%s) to int: %s. Using default value %s", scroll_attempts, e, MAX_SCROLL_ATTEMPTS)
-                    scroll_attempts = MAX_SCROLL_ATTEMPTS
-        self.max_scroll_attempts = scroll_attempts
+        try:
+            # A sequence (e.g. a one-element tuple) contributes its first element
+            if isinstance(scroll_attempts, (tuple, list)):
+                scroll_attempts = scroll_attempts[0]
+            self.max_scroll_attempts = int(scroll_attempts)
+        except (ValueError, TypeError, IndexError) as e:
+            logger.error("Cannot convert max_scroll_attempts (%s) to int: %s. Using default value %s", scroll_attempts, e, MAX_SCROLL_ATTEMPTS)
+            self.max_scroll_attempts = MAX_SCROLL_ATTEMPTS
 
         self.driver: Optional[webdriver.Firefox] = None
         self.wait: Optional[WebDriverWait] = None
+        # Logged-in browsers shared with scrapers created by for_search; the
+        # scraper that created the pool closes it.
+        self._driver_pool = DriverPool()
+        self._owns_driver_pool = True
+        # Search results URL reached by navigate_to_search, reloaded on later runs
+        self._search_page_url: Optional[str] = None
+        # Session cookies and headers copied from the browser after login;
+        # None until a logged-in session is available to the Voyager API.
+        self._api_cookies: Optional[httpx.Cookies] = None
+        self._api_headers: Dict[str, str] = {}
+        # Whether the last Voyager search returned any results, seen or not;
+        # only a search that returned nothing falls back to the browser.
+        self._api_returned_results = False
+        # URLs of posts already saved, reported through mark_seen and kept
+        # across runs so they are skipped before their details are extracted.
+        # Posts only yielded are not added: a post whose save failed is
+        # fetched again on the next run.
+        self._seen_urls: set[str] = set()
+        # URLs of Voyager results dropped by the job keyword filter. The
+        # rejection is deterministic, so they count as seen when deciding
+        # whether a results page holds anything new.
+        self._rejected_urls: set[str] = set()
+        # Output CSV kept open across save_to_csv calls; see _open_csv.
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        self._csv_unflushed_rows = 0
+        self._csv_unflushed_urls: List[str] = []
 
-        self.indian_cities = set(INDIAN_CITIES)
         self.job_keywords = JOB_KEYWORDS
-        self.job_pattern = re.compile("|".join(self.job_keywords), re.IGNORECASE)
+        self.job_pattern = JOB_KEYWORDS_RE
 
         logger.info(
             "Initialized LinkedInJobScraper with search='%s' and max_scroll=%s",
@@ -135,11 +334,23 @@ class LinkedInJobScraper:
         """
         Initialize and configure the Selenium WebDriver.
 
+        Firefox runs headless unless disabled in the config, loads no images
+        or web fonts, and returns from page loads once the DOM is ready.
+
         Returns:
             Firefox WebDriver instance
         """
         logger.debug("Setting up Firefox WebDriver with wait timeout %s", WEBDRIVER_WAIT_TIMEOUT)
-        self.driver = webdriver.Firefox()
+        options = webdriver.FirefoxOptions()
+        if HEADLESS_BROWSER:
+            options.add_argument("-headless")
+        # Every step waits for the elements it needs, so there is no reason
+        # to block on subresources after DOMContentLoaded.
+        options.page_load_strategy = "eager"
+        for name, value in FIREFOX_PREFERENCES.items():
+            options.set_preference(name, value)
+
+        self.driver = webdriver.Firefox(options=options)
         self.wait = WebDriverWait(self.driver, WEBDRIVER_WAIT_TIMEOUT)
         return self.driver
 
@@ -225,172 +436,192 @@ class LinkedInJobScraper:
     def scrape_posts(
         self,
         max_scroll_attempts: Optional[int] = None,
-    ) -> List[Dict[str, str]]:
+    ) -> Iterator[Dict[str, str]]:
         """
         Main function to scrape posts from the current page.
 
-        Scrolls the page, finds post elements, extracts details,
-        filters for relevant posts, and saves incrementally.
+        Scrolls the page, extracts post details and yields them one at a
+        time, so callers can process or save posts without holding them
+        all in memory. Errors are logged and end the iteration; posts
+        yielded before the error are kept by the caller. Errors that mean the
+        browser session itself is gone are raised instead, so the caller can
+        discard the driver.
 
         Args:
             max_scroll_attempts: Maximum number of scroll attempts
                                 (defaults to instance max_scroll_attempts)
 
-        Returns:
-            List of dictionaries containing post data, or empty list on error
+        Yields:
+            Dictionaries containing post data, one per post URL not yet
+            passed to `mark_seen`
         """
         try:
             scroll_attempts = max_scroll_attempts if max_scroll_attempts is not None else self.max_scroll_attempts
-            # Ensure scroll_attempts is an integer
-            if not isinstance(scroll_attempts, int):
-                if isinstance(scroll_attempts, (tuple, list)) and len(scroll_attempts) == 1:
-                    logger.warning("max_scroll_attempts is a sequence (%s), extracting first element", type(scroll_attempts).__name__)
-                    scroll_attempts = int(scroll_attempts[0])
-                elif isinstance(scroll_attempts, (tuple, list)) and len(scroll_attempts) > 1:
-                    logger.error("max_scroll_attempts is a sequence with multiple elements (%s), using first element", scroll_attempts)
-                    scroll_attempts = int(scroll_attempts[0])
-                else:
-                    try:
-                        logger.warning("max_scroll_attempts is not an integer (%s), converting to int", type(scroll_attempts).__name__)
-                        scroll_attempts = int(scroll_attempts)
-                    except (ValueError, TypeError) as e:
-                        logger.error("Cannot convert max_scroll_attempts (%s) to int: %s. Using instance value %s", scroll_attempts, e, self.max_scroll_attempts)
-                        scroll_attempts = self.max_scroll_attempts
-
             logger.info("Starting scrape cycle (max_scroll=%s)", scroll_attempts)
-            self.driver.maximize_window()
-            fetched_posts: List[Dict[str, str]] = []
-            processed_urls = set()
             body = self.driver.find_element(By.TAG_NAME, "body")
 
             self._scroll_page(body, scroll_attempts)
-            posts = self._find_post_elements()
+            rows = self.driver.execute_script(
+                EXTRACT_POSTS_SCRIPT,
+                SELECTORS["post_containers"],
+                SELECTORS["post_content"],
+                SELECTORS["post_actor_title"],
+                self.job_pattern.pattern if SCRAPE_JOB_POSTS_ONLY else None,
+            )
 
-            if not posts:
+            if not rows:
                 logger.warning("No posts found on page")
-                return []
+                return
 
-            for post_element in posts:
-                post_data = self.extract_post_details(post_element)
+            logger.debug("Extracted %s post elements from page", len(rows))
+            skipped = 0
+            yielded_urls = set()
+            for row in rows:
+                if not row.get("urn"):
+                    continue
+                url = LINKEDIN_POST_BASE_URL + row["urn"]
+                if url in self._seen_urls:
+                    skipped += 1
+                    continue
+                if url in yielded_urls:
+                    continue
 
-                if not post_data or post_data["url"] in processed_urls:
+                post_data = self._post_from_row(row)
+                if not post_data:
                     continue
 
-                processed_urls.add(post_data["url"])
-                fetched_posts.append(post_data)
-                logger.debug("Queued post #%s: %s", len(fetched_posts), post_data["url"])
+                yielded_urls.add(url)
+                logger.debug("Queued post %s", post_data["url"])
+                yield post_data
 
-            logger.info("Scraping completed; collected %s posts", len(fetched_posts))
-            return fetched_posts
+            logger.debug("Skipped %s posts seen in earlier runs", skipped)
 
+        except (InvalidSessionIdException, NoSuchWindowException):
+            raise
         except Exception:
             logger.exception("Error encountered during scraping")
-            return []
 
-    def save_to_csv(self, posts: List[Dict[str, str]], filename: str) -> None:
+    def save_to_csv(self, posts: Iterable[Dict[str, str]], filename: str) -> int:
         """
         Save posts to CSV file in append mode.
 
-        Creates the file with headers if it doesn't exist.
+        Creates the file with headers if it doesn't exist. Posts are consumed
+        lazily, so a generator such as `scrape_posts` is written as it runs.
+        The file stays open between calls. Rows are written and flushed in
+        chunks of `CSV_FLUSH_ROWS`; the remainder is flushed at the end of each
+        `save_searches` cycle and when the scraper is closed.
+        Posts are marked as seen once their rows are flushed to disk.
 
         Args:
-            posts: List of dictionaries containing post data
+            posts: Iterable of dictionaries containing post data
             filename: Path to CSV file
-        """
-        file_exists = os.path.exists(filename)
 
-        with open(filename, "a", newline="", encoding="utf-8") as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDNAMES)
+        Returns:
+            Number of posts written
+        """
+        writer = self._open_csv(filename)
+        written = 0
+        posts = iter(posts)
+        while chunk := list(islice(posts, CSV_FLUSH_ROWS - self._csv_unflushed_rows)):
+            writer.writerows(chunk)
+            written += len(chunk)
+            self._csv_unflushed_rows += len(chunk)
+            self._csv_unflushed_urls.extend(post["url"] for post in chunk)
+            if self._csv_unflushed_rows >= CSV_FLUSH_ROWS:
+                self._flush_csv()
+        logger.info("Appended %s posts to %s", written, filename)
+        return written
+
+    def mark_seen(self, urls: Iterable[str]) -> None:
+        """
+        Record posts as saved, so later runs skip them.
 
-            if not file_exists:
-                writer.writeheader()
+        Callers that persist posts themselves call this once the posts are
+        safely stored; `save_to_csv` does so on its own. Scrapers created by
+        `for_search` share the record.
 
-            writer.writerows(posts)
-        logger.info("Appended %s posts to %s", len(posts), filename)
+        Args:
+            urls: URLs of the saved posts
+        """
+        self._seen_urls.update(urls)
 
     def extract_post_details(self, post_element) -> Optional[Dict[str, str]]:
         """
         Extract relevant details from a post element.
 
+        All fields are read in a single WebDriver round-trip.
+
         Args:
             post_element: Selenium WebElement representing a LinkedIn post
 
         Returns:
-            Dictionary with 'content', 'url', and 'name' keys, or None on error
+            Dictionary with 'content', 'url', and 'profile_name' keys, or None
+            if the post is incomplete or on error
         """
         try:
-            content_element = post_element.find_element(
-                By.CSS_SELECTOR, SELECTORS["post_content"],
+            row = self.driver.execute_script(
+                EXTRACT_POST_SCRIPT,
+                post_element,
+                SELECTORS["post_content"],
+                SELECTORS["post_actor_title"],
             )
-            content = content_element.text.strip()
-
-            if not content:
-                return None
-
-            name_element = post_element.find_element(
-                By.CSS_SELECTOR, SELECTORS["post_actor_title"],
-            )
-            profile_name = name_element.text.split("\n")[0].strip()
-
-            data_urn = post_element.get_attribute("data-urn")
-            post_url = f"{LINKEDIN_POST_BASE_URL}{data_urn}" if data_urn else None
-
-            if not post_url:
-                return None
-
-            logger.debug("Extracted post details for %s", post_url)
-            return {
-                "content": content,
-                "url": post_url,
-                "profile_name": profile_name,
-            }
-        except (NoSuchElementException, Exception):
+        except Exception:
             logger.exception("Error extracting post details")
             return None
 
-    def is_job_post(self, content: str) -> bool:
+        post_data = self._post_from_row(row or {})
+        if post_data:
+            logger.debug("Extracted post details for %s", post_data["url"])
+        return post_data
+
+    def is_job_post(self, content_lower: str) -> bool:
         """
         Determine if the content represents a job posting.
 
         Uses pattern matching and keyword detection to identify job postings.
-        Requires at least 2 job-related indicators to confirm.
+        Requires a job keyword and at least 2 job-related indicators to
+        confirm, all found in a single scan of the content.
 
         Args:
-            content: Text content to analyze
+            content_lower: Lowercased text content to analyze
 
         Returns:
             True if content appears to be a job posting, False otherwise
         """
-        if not content:
+        if not content_lower:
             return False
 
-        if not self.job_pattern.search(content):
-            return False
+        # Step one character past each hit rather than past the whole match,
+        # so signals overlapping an earlier match (e.g. "apply", which is
+        # both a job keyword and an apply action) are still found.
+        found = set()
+        position = 0
+        while (signal := _RE_JOB_SIGNALS.search(content_lower, position)) is not None:
+            start = signal.start()
+            for name, pattern in _JOB_SIGNALS.items():
+                match = pattern.match(content_lower, start)
+                if match:
+                    # Each extra keyword counts as its own indicator
+                    found.add(f"extra:{match.group()}" if name == "extra" else name)
+            if "keyword" in found and len(found) >= 3:
+                return True
+            position = start + 1
 
-        has_requirements = re.search(
-            r"requirements?|qualifications?", content, re.IGNORECASE
-        )
-        has_experience = re.search(
-            r"\d+\+?\s*years?|years? of experience", content, re.IGNORECASE
-        )
-        has_apply_action = re.search(
-            r"apply|send|email|dm|interested|opportunity", content, re.IGNORECASE
-        )
+        return False
 
-        content_lower = content.lower()
-        indicators = sum(
-            [
-                bool(has_requirements),
-                bool(has_experience),
-                bool(has_apply_action),
-                "resume" in content_lower,
-                "cv" in content_lower,
-                "position" in content_lower,
-                "role" in content_lower,
-            ]
-        )
+    def matched_cities(self, text: str) -> set[str]:
+        """
+        Find the Indian cities mentioned in a text.
 
-        return indicators >= 2
+        All of INDIAN_CITIES are matched in a single scan of the text.
+
+        Args:
+            text: Text content to analyze
+
+        Returns:
+            Lowercase names of the cities found, empty if none
+        """
+        return {city.lower() for city in INDIAN_CITIES_RE.findall(text)}
 
     def is_relevant_post(self, post_data: Optional[Dict]) -> bool:
         """
@@ -415,22 +646,101 @@ class LinkedInJobScraper:
         """
         Main execution function.
 
-        Refreshes the page and runs the scraping process.
+        Fetches posts from the Voyager API, or refreshes the page and runs
+        the browser scraping process when the API yields nothing.
         """
-        self.driver.refresh()
-        logger.debug("Browser refreshed; starting scrape run")
-        posts = self.scrape_posts(self.max_scroll_attempts)
-        logger.info("Scrape run collected %s posts", len(posts))
-        return posts
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> List[Dict[str, str]]:
+        """
+        Coroutine version of `run`, so several searches can share one event loop.
+
+        The browser fallback blocks, so it runs in a worker thread.
+        """
+        if self._api_cookies is not None:
+            posts = await self._collect_api_posts()
+            if self._api_returned_results:
+                logger.info("Scrape run collected %s posts from the Voyager API", len(posts))
+                return posts
+            logger.warning("Voyager API returned no posts; falling back to browser scraping")
+
+        return await asyncio.to_thread(self._run_browser)
+
+    def for_search(self, search_text: str) -> "LinkedInJobScraper":
+        """
+        Create a scraper for another search query that reuses this login.
+
+        The copy shares the Voyager API session cookies, the sets of posts
+        already saved or rejected and the driver pool. If it has to fall back to DOM
+        scraping it borrows its own driver from the pool, since a WebDriver
+        session cannot be driven by two searches at once.
+
+        Args:
+            search_text: Search query text for the new scraper
+
+        Returns:
+            LinkedInJobScraper for `search_text`
+        """
+        worker = copy.copy(self)
+        worker.search_text = search_text
+        worker.driver = None
+        worker.wait = None
+        worker._owns_driver_pool = False
+        worker._search_page_url = None
+        worker._csv_file = None
+        worker._csv_writer = None
+        worker._csv_unflushed_rows = 0
+        worker._csv_unflushed_urls = []
+        return worker
+
+    async def stream(self) -> AsyncIterator[Dict[str, str]]:
+        """
+        Yield posts as they are fetched from the Voyager API, or as they are
+        extracted from the refreshed page when the API yields nothing.
+
+        WebDriver calls block, so each browser step runs in a worker thread
+        and the event loop stays free to classify earlier posts meanwhile.
+        A browser that fails with a WebDriver error is quit instead of being
+        returned to the pool, so the next run starts a fresh one.
+        """
+        if self._api_cookies is not None:
+            count = 0
+            async for post in self._iter_api_posts():
+                count += 1
+                yield post
+            if self._api_returned_results:
+                logger.info("Scrape run streamed %s posts from the Voyager API", count)
+                return
+            logger.warning("Voyager API returned no posts; falling back to browser scraping")
+
+        count = 0
+        try:
+            await asyncio.to_thread(self._open_search_page)
+            logger.debug("Search page loaded; starting streamed scrape run")
+            posts = self.scrape_posts(self.max_scroll_attempts)
+            while (post := await asyncio.to_thread(next, posts, None)) is not None:
+                count += 1
+                yield post
+        except WebDriverException:
+            logger.exception("Browser failed during scrape run; discarding it")
+            await asyncio.to_thread(self._quit_driver)
+        finally:
+            self._release_browser()
+        logger.info("Scrape run streamed %s posts", count)
+
     def close(self) -> None:
         """
         Close the WebDriver and cleanup resources.
+
+        Scrapers created by `for_search` return their driver to the pool;
+        the scraper that owns the pool quits every driver in it.
         """
-        if self.driver:
-            logger.info("Closing WebDriver session")
-            self.driver.quit()
-            self.driver = None
-            self.wait = None
+        self._release_browser()
+        if self._owns_driver_pool:
+            self._driver_pool.close()
+        self._close_csv()
+        self._api_cookies = None
+        self._api_headers = {}
 
     # ------------------------------------------------------------------
     # Private helper methods
@@ -441,15 +751,335 @@ class LinkedInJobScraper:
         Initialize the scraper: setup driver, login, and navigate to search.
 
         This method orchestrates the initial setup sequence with delays
-        between steps to avoid detection.
+        between steps to avoid detection. When the login yields a session
+        usable by the Voyager API, the browser is closed instead of being
+        navigated to the search results; otherwise it is returned to the
+        driver pool, logged in and on the search results page.
         """
         logger.debug("Beginning scraper initialization sequence")
-        self.setup_driver()
-        self.random_sleep()
-        self.login()
+        self._acquire_browser()
+        if self._start_api_session():
+            logger.info("Voyager API session ready; closing browser")
+            self._quit_driver()
+            return
+        self._open_search_page()
         self.random_sleep()
-        self.navigate_to_search()
+        self._release_browser()
+
+    def _new_logged_in_driver(self) -> webdriver.Firefox:
+        """
+        Start a browser and log it in; called by the driver pool when it needs a new driver.
+
+        A session saved by an earlier login is restored when it is still
+        valid; otherwise the login form is used and the new session saved.
+        """
+        logger.info("Starting a new logged-in browser")
+        try:
+            self.setup_driver()
+            if not self._restore_session():
+                self.random_sleep()
+                if self.login():
+                    self._save_session()
+        except Exception:
+            # The pool does not count a driver whose creation failed
+            if self.driver is not None:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    logger.debug("Could not quit half-started WebDriver", exc_info=True)
+                self.driver = None
+                self.wait = None
+            raise
         self.random_sleep()
+        return self.driver
+
+    def _restore_session(self) -> bool:
+        """
+        Log the browser in with the cookies saved at `LINKEDIN_COOKIES_PATH`.
+
+        Returns:
+            True if a saved session was found and is still valid, False otherwise
+        """
+        try:
+            with open(LINKEDIN_COOKIES_PATH, encoding="utf-8") as cookie_file:
+                cookies = json.load(cookie_file)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError):
+            logger.warning("Could not read saved session from %s", LINKEDIN_COOKIES_PATH, exc_info=True)
+            return False
+
+        # Cookies can only be added for the domain of the current page
+        self.driver.get(LINKEDIN_HOME_URL)
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException:
+                logger.debug("Skipping saved cookie %s", cookie.get("name"))
+
+        self.driver.get(LINKEDIN_FEED_URL)
+        try:
+            self.wait.until(EC.presence_of_element_located(SELECTORS["global_nav"]))
+        except TimeoutException:
+            logger.info("Saved LinkedIn session has expired; logging in again")
+            return False
+
+        logger.info("Restored LinkedIn session from %s", LINKEDIN_COOKIES_PATH)
+        return True
+
+    def _save_session(self) -> None:
+        """Save the browser's cookies to `LINKEDIN_COOKIES_PATH`, readable only by the current user."""
+        try:
+            os.makedirs(os.path.dirname(LINKEDIN_COOKIES_PATH), exist_ok=True)
+            descriptor = os.open(LINKEDIN_COOKIES_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(descriptor, "w", encoding="utf-8") as cookie_file:
+                json.dump(self.driver.get_cookies(), cookie_file)
+        except OSError:
+            logger.warning("Could not save session to %s", LINKEDIN_COOKIES_PATH, exc_info=True)
+            return
+        logger.debug("Saved LinkedIn session to %s", LINKEDIN_COOKIES_PATH)
+
+    def _acquire_browser(self) -> None:
+        """Borrow a logged-in driver from the pool, if none is held."""
+        if self.driver is None:
+            self.driver = self._driver_pool.acquire(self._new_logged_in_driver)
+            self.wait = WebDriverWait(self.driver, WEBDRIVER_WAIT_TIMEOUT)
+
+    def _open_search_page(self) -> None:
+        """
+        Borrow a driver and load this scraper's search results on it.
+
+        The first time, the results are reached through the search UI; later
+        runs reload the resulting URL, which also refreshes the results.
+        """
+        self._acquire_browser()
+        if self._search_page_url:
+            self.driver.get(self._search_page_url)
+        elif self.navigate_to_search():
+            self._search_page_url = self.driver.current_url
+
+    def _release_browser(self) -> None:
+        """Return the borrowed driver, if any, to the pool."""
+        if self.driver is not None:
+            self._driver_pool.release(self.driver)
+            self.driver = None
+            self.wait = None
+
+    def _run_browser(self) -> List[Dict[str, str]]:
+        """
+        Reload the search results page and scrape it with a pooled browser.
+
+        A browser that fails with a WebDriver error is quit instead of being
+        returned to the pool, so the next run starts a fresh one.
+        """
+        posts: List[Dict[str, str]] = []
+        try:
+            self._open_search_page()
+            logger.debug("Search page loaded; starting scrape run")
+            posts.extend(self.scrape_posts(self.max_scroll_attempts))
+        except WebDriverException:
+            logger.exception("Browser failed during scrape run; discarding it")
+            self._quit_driver()
+        finally:
+            self._release_browser()
+        logger.info("Scrape run collected %s posts", len(posts))
+        return posts
+
+    def _quit_driver(self) -> None:
+        """Quit the borrowed driver, if any, instead of returning it to the pool."""
+        if self.driver is not None:
+            self._driver_pool.discard(self.driver)
+            self.driver = None
+            self.wait = None
+
+    def _open_csv(self, filename: str) -> csv.DictWriter:
+        """
+        Return the CSV writer for `filename`, opening the file on first use.
+
+        Switching to another filename closes the previous file.
+        """
+        if self._csv_file is not None and self._csv_file.name != filename:
+            self._close_csv()
+
+        if self._csv_file is None:
+            self._csv_file = open(
+                filename, "a", buffering=CSV_BUFFER_SIZE, newline="", encoding="utf-8"
+            )
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDNAMES)
+            if self._csv_file.tell() == 0:
+                self._csv_writer.writeheader()
+            logger.debug("Opened %s for buffered appends", filename)
+        return self._csv_writer
+
+    def _flush_csv(self) -> None:
+        """Write buffered CSV rows to disk and mark their posts as seen."""
+        if self._csv_file is not None:
+            self._csv_file.flush()
+            self._csv_unflushed_rows = 0
+            self.mark_seen(self._csv_unflushed_urls)
+            self._csv_unflushed_urls = []
+
+    def _close_csv(self) -> None:
+        """Flush and close the output CSV, if one is open."""
+        if self._csv_file is not None:
+            self._flush_csv()
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+
+    def _start_api_session(self) -> bool:
+        """
+        Copy the browser's login session for use with the Voyager API.
+
+        Returns:
+            True if the session cookies needed by the API were found, False otherwise
+        """
+        cookies = httpx.Cookies()
+        for cookie in self.driver.get_cookies():
+            cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""))
+
+        if not cookies.get("li_at") or not cookies.get("JSESSIONID"):
+            logger.warning("Session cookies missing after login; using browser scraping")
+            return False
+
+        self._api_cookies = cookies
+        self._api_headers = {
+            "csrf-token": cookies.get("JSESSIONID").strip('"'),
+            "accept": "application/vnd.linkedin.normalized+json+2.1",
+            "x-restli-protocol-version": "2.0.0",
+            "user-agent": self.driver.execute_script("return navigator.userAgent;"),
+        }
+        return True
+
+    async def _collect_api_posts(self) -> List[Dict[str, str]]:
+        """Collect every post yielded by `_iter_api_posts` into a list."""
+        return [post async for post in self._iter_api_posts()]
+
+    async def _iter_api_posts(self) -> AsyncIterator[Dict[str, str]]:
+        """
+        Yield posts from the Voyager search API, newest first.
+
+        Fetches up to `max_scroll_attempts` pages, the API counterpart of
+        scrolling the results page. Since results are newest first, paging
+        stops at the first page whose posts were all saved or rejected by the
+        keyword filter before. HTTP errors are logged and end the iteration;
+        posts yielded before the error are kept by the caller.
+
+        Yields:
+            Dictionaries containing post data, one per post URL not yet
+            passed to `mark_seen`
+        """
+        self._api_returned_results = False
+        yielded_urls = set()
+        # Pauses between page requests, drawn once per run; there is no pause
+        # before the first page or after the last one.
+        delays = [
+            random.uniform(MIN_SLEEP_TIME, MAX_SLEEP_TIME)
+            for _ in range(self.max_scroll_attempts - 1)
+        ]
+        async with httpx.AsyncClient(
+            http2=True,
+            cookies=self._api_cookies,
+            headers=self._api_headers,
+            timeout=WEBDRIVER_WAIT_TIMEOUT,
+        ) as session:
+            for page in range(self.max_scroll_attempts):
+                if page:
+                    await asyncio.sleep(delays[page - 1])
+                try:
+                    response = await session.get(self._search_url(page * VOYAGER_PAGE_SIZE))
+                    response.raise_for_status()
+                    posts = self._parse_search_page(response.json())
+                except (httpx.HTTPError, ValueError):
+                    logger.exception("Voyager search request failed on page %s", page + 1)
+                    return
+
+                if not posts:
+                    logger.debug("Voyager search exhausted after %s pages", page)
+                    return
+
+                self._api_returned_results = True
+                new_posts = [
+                    post
+                    for post in posts
+                    if post["url"] not in self._seen_urls and post["url"] not in self._rejected_urls
+                ]
+                if not new_posts:
+                    # Results are newest first, so later pages were seen too
+                    logger.debug("Voyager search caught up with earlier runs after %s pages", page + 1)
+                    return
+
+                for post_data in new_posts:
+                    # Results shift as new posts arrive, so pages can overlap
+                    if post_data["url"] in yielded_urls:
+                        continue
+                    yielded_urls.add(post_data["url"])
+                    # Lowercasing first and matching case-sensitively is about
+                    # 3x faster than an IGNORECASE search of the original text
+                    if SCRAPE_JOB_POSTS_ONLY and not _RE_JOB_KEYWORDS.search(post_data["content"].lower()):
+                        self._rejected_urls.add(post_data["url"])
+                        continue
+                    yield post_data
+
+    def _search_url(self, start: int) -> str:
+        """
+        Build the Voyager content search URL for results starting at `start`.
+
+        The URL is assembled by hand because the API expects its Rest.li
+        variables unencoded, which an httpx `params` dict would escape.
+        """
+        variables = (
+            f"(start:{start},origin:GLOBAL_SEARCH_HEADER,"
+            f"query:(keywords:{quote(self.search_text or '')},flagshipSearchIntent:SEARCH_SRP,"
+            "queryParameters:List((key:resultType,value:List(CONTENT)),"
+            "(key:sortBy,value:List(date_posted))),"
+            "includeFiltersInResponse:false))"
+        )
+        return f"{VOYAGER_GRAPHQL_URL}?variables={variables}&queryId={VOYAGER_SEARCH_QUERY_ID}"
+
+    @staticmethod
+    def _parse_search_page(payload: Dict) -> List[Dict[str, str]]:
+        """
+        Extract post details from a normalized Voyager search response.
+
+        Content results arrive either as feed updates or as search entity
+        results; both are mapped to the keys produced by `extract_post_details`.
+
+        Args:
+            payload: Decoded JSON body of a Voyager search response
+
+        Returns:
+            List of dictionaries with 'content', 'url', and 'profile_name' keys
+        """
+
+        def text_of(entity: Optional[Dict], key: str) -> str:
+            return (((entity or {}).get(key) or {}).get("text") or "").strip()
+
+        posts = []
+        for entity in payload.get("included", []):
+            if "commentary" in entity:
+                content = text_of(entity.get("commentary"), "text")
+                profile_name = text_of(entity.get("actor"), "name")
+                urns = f"{(entity.get('metadata') or {}).get('backendUrn', '')} {entity.get('entityUrn', '')}"
+            elif "summary" in entity and "title" in entity:
+                content = text_of(entity, "summary")
+                profile_name = text_of(entity, "title")
+                urns = f"{entity.get('trackingUrn', '')} {entity.get('entityUrn', '')}"
+            else:
+                continue
+
+            match = ACTIVITY_URN_PATTERN.search(urns)
+            if not content or not match:
+                continue
+
+            posts.append(
+                {
+                    "content": content,
+                    "url": LINKEDIN_POST_BASE_URL + match.group(),
+                    "profile_name": profile_name,
+                }
+            )
+        return posts
 
     def _perform_search(self) -> None:
         """Perform the search query."""
@@ -521,61 +1151,177 @@ class LinkedInJobScraper:
     def _scroll_page(self, body_element, scroll_attempts: int) -> None:
         """
         Scroll the page to load more content.
-        Uses JavaScript scrolling which works even when window is in background.
+        Uses JavaScript scrolling which works even when window is in background,
+        and stops as soon as a scroll no longer loads more posts.
 
         Args:
             body_element: Body element to scroll (kept for compatibility)
             scroll_attempts: Number of times to scroll
         """
-        # Ensure scroll_attempts is an integer
-        if not isinstance(scroll_attempts, int):
-            if isinstance(scroll_attempts, (tuple, list)) and len(scroll_attempts) == 1:
-                logger.warning("scroll_attempts is a sequence (%s), extracting first element", type(scroll_attempts).__name__)
-                scroll_attempts = int(scroll_attempts[0])
-            elif isinstance(scroll_attempts, (tuple, list)) and len(scroll_attempts) > 1:
-                logger.error("scroll_attempts is a sequence with multiple elements (%s), using first element", scroll_attempts)
-                scroll_attempts = int(scroll_attempts[0])
-            else:
-                try:
-                    logger.warning("scroll_attempts is not an integer (%s), converting to int", type(scroll_attempts).__name__)
-                    scroll_attempts = int(scroll_attempts)
-                except (ValueError, TypeError) as e:
-                    logger.error("Cannot convert scroll_attempts (%s) to int: %s. Using default value 20", scroll_attempts, e)
-                    scroll_attempts = 20
-        
-        # Use JavaScript scrolling - this works even when window doesn't have focus
-        # This is the key fix for background operation
+        # Scroll to the bottom and wait for the feed to grow; stop early once
+        # a scroll loads nothing new instead of sleeping through every attempt.
+        # JavaScript scrolling doesn't require window focus.
+        height = self.driver.execute_script("return document.body.scrollHeight;")
         for attempt in range(scroll_attempts):
             logger.debug("Scroll attempt %s/%s", attempt + 1, scroll_attempts)
-            # JavaScript scrolling doesn't require window focus
-            self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
-            self.random_sleep()
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            try:
+                height = WebDriverWait(self.driver, SCROLL_LOAD_TIMEOUT, poll_frequency=0.25).until(
+                    lambda driver: self._grown_height(driver, height)
+                )
+            except TimeoutException:
+                logger.debug("Page stopped growing after %s scrolls", attempt + 1)
+                break
 
-    def _find_post_elements(self) -> List:
+    @staticmethod
+    def _grown_height(driver, height: int) -> Optional[int]:
+        """Return the page's scroll height if it exceeds `height`, else None."""
+        new_height = driver.execute_script("return document.body.scrollHeight;")
+        return new_height if new_height > height else None
+
+    @staticmethod
+    def _post_from_row(row: Dict[str, Optional[str]]) -> Optional[Dict[str, str]]:
         """
-        Find post elements using multiple CSS selectors.
+        Build post data from one row returned by `EXTRACT_POSTS_SCRIPT`.
 
-        Tries each selector until posts are found.
+        Args:
+            row: Dictionary with 'urn', 'content', and 'name' keys
 
         Returns:
-            List of WebElements representing posts
-        """
-        posts: List = []
-        for selector in SELECTORS["post_containers"]:
-            logger.debug("Searching for posts using selector: %s", selector)
-            posts = self.driver.find_elements(By.CSS_SELECTOR, selector)
-            if posts:
-                logger.debug("Found %s posts with selector %s", len(posts), selector)
-                break
-        return posts
+            Dictionary with 'content', 'url', and 'profile_name' keys, or None
+            if the post has no content, author or URN
+        """
+        content = (row.get("content") or "").strip()
+        if not content or row.get("name") is None or not row.get("urn"):
+            return None
+
+        return {
+            "content": content,
+            "url": LINKEDIN_POST_BASE_URL + row["urn"],
+            "profile_name": row["name"].partition("\n")[0].strip(),
+        }
+
+
+async def stream_searches(
+    workers: List[LinkedInJobScraper],
+    max_concurrency: int = SEARCH_CONCURRENCY,
+) -> AsyncIterator[Dict[str, str]]:
+    """
+    Stream posts from several scrapers, at most `max_concurrency` at a time.
+
+    Posts are yielded as soon as any scraper produces them. A scraper that
+    fails is logged and skipped; the others keep running.
+
+    Args:
+        workers: Scrapers to run, typically one per search query
+        max_concurrency: Maximum number of scrapers running at once
+
+    Yields:
+        Posts from all scrapers, deduplicated by URL
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    posts: asyncio.Queue = asyncio.Queue()
+    finished = object()
 
+    async def run_worker(worker: LinkedInJobScraper) -> None:
+        try:
+            async with semaphore:
+                async for post in worker.stream():
+                    await posts.put(post)
+        except Exception:
+            logger.exception("Scrape failed for search '%s'", worker.search_text)
+        finally:
+            await posts.put(finished)
+
+    tasks = [asyncio.create_task(run_worker(worker)) for worker in workers]
+    remaining = len(tasks)
+    seen_urls = set()
+    try:
+        while remaining:
+            post = await posts.get()
+            if post is finished:
+                remaining -= 1
+            elif post["url"] not in seen_urls:
+                seen_urls.add(post["url"])
+                yield post
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def scrape_searches(
+    workers: List[LinkedInJobScraper],
+    max_concurrency: int = SEARCH_CONCURRENCY,
+) -> List[Dict[str, str]]:
+    """
+    Run several scrapers concurrently and collect their posts.
+
+    Args:
+        workers: Scrapers to run, typically one per search query
+        max_concurrency: Maximum number of scrapers running at once
+
+    Returns:
+        Posts from all scrapers, deduplicated by URL
+    """
+    return [post async for post in stream_searches(workers, max_concurrency)]
+
+
+async def save_searches(
+    workers: List[LinkedInJobScraper],
+    filename: str,
+    max_concurrency: int = SEARCH_CONCURRENCY,
+) -> int:
+    """
+    Stream posts from several scrapers into a CSV file as they arrive.
 
-def scrape_jobs() -> None:
-    """Main entry point for running the scraper in a loop."""
-    scraper = LinkedInJobScraper()
+    Posts are written through the first scraper's buffered writer in chunks
+    of `CSV_FLUSH_ROWS`, so at most one chunk is held in memory. The buffer
+    is flushed when the searches finish, even on error, so a cycle's posts
+    reach disk before the wait for the next one.
+
+    Args:
+        workers: Scrapers to run, typically one per search query
+        filename: Path to CSV file
+        max_concurrency: Maximum number of scrapers running at once
+
+    Returns:
+        Number of posts written
+    """
+    writer = workers[0]
+    written = 0
+    chunk: List[Dict[str, str]] = []
+    try:
+        async for post in stream_searches(workers, max_concurrency):
+            chunk.append(post)
+            if len(chunk) >= CSV_FLUSH_ROWS:
+                written += writer.save_to_csv(chunk, filename)
+                chunk = []
+        if chunk:
+            written += writer.save_to_csv(chunk, filename)
+    finally:
+        writer._flush_csv()
+    return written
+
+
+def scrape_jobs(search_texts: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for running the scraper in a loop.
+
+    Posts are appended to `SCRAPED_POSTS_CSV_FILENAME` as they are scraped.
+
+    Args:
+        search_texts: Search queries to scrape concurrently (defaults to config SEARCH_TEXT)
+    """
+    search_texts = search_texts or [SEARCH_TEXT]
+    scraper = LinkedInJobScraper(search_text=search_texts[0])
+    workers = [scraper] + [scraper.for_search(text) for text in search_texts[1:]]
     try:
         while True:
-            posts = scraper.run()
+            saved = asyncio.run(save_searches(workers, SCRAPED_POSTS_CSV_FILENAME))
+            logger.info(
+                "Saved %s posts across %s searches", saved, len(workers)
+            )
             logger.info(
                 "Waiting for the next interval (%s minutes)...", RUN_INTERVAL // 60
             )
@@ -583,9 +1329,9 @@ def scrape_jobs() -> None:
     except KeyboardInterrupt:
         logger.info("Scraper interrupted by user")
     finally:
-        scraper.close()
+        for worker in workers:
+            worker.close()
 
 
 if __name__ == "__main__":
-    scrape_jobs()
-
+    scrape_jobs(sys.argv[1:])